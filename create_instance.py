@@ -9,10 +9,19 @@ availability domains and fault domains until successful.
 import os
 import sys
 import time
+import re
+import json
+import uuid
+import random
 import logging
+import logging.handlers
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 try:
     import oci
@@ -45,6 +54,73 @@ PROJECT_ROOT = Path(__file__).parent
 FLAG_FILE = PROJECT_ROOT / ".instance_created"
 LOG_DIR = PROJECT_ROOT / "logs"
 LOG_FILE = LOG_DIR / "attempts.log"
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUP_COUNT = 3
+LOG_BUFFER_CAPACITY = 64
+STATE_FILE = PROJECT_ROOT / ".state.json"
+LOCK_FILE = PROJECT_ROOT / ".hunter.lock"
+# A lock older than this is left over from a crashed run
+LOCK_STALE_SECONDS = 900
+
+# Backoff between launch attempts (seconds)
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 300.0
+BACKOFF_JITTER = 0.5
+BACKOFF_MAX_EXPONENT = 5
+# Total time a run may spend sleeping; kept well under the 5-15 minute
+# schedule so scheduled runs don't overlap
+RUN_SLEEP_BUDGET_SECONDS = 180.0
+
+# OCI service error codes mapped to error types; OCI reports A1 capacity
+# shortages as a 500 InternalError ("Out of host capacity")
+ERROR_CODE_MAP = {
+    'OutOfCapacity': 'capacity',
+    'InternalError': 'capacity',
+    'LimitExceeded': 'quota',
+    'QuotaExceeded': 'quota',
+}
+
+# Congestion tracking: recent launch outcomes ('capacity' / 'success');
+# outcomes older than CONGESTION_MAX_AGE_SECONDS are dropped
+CONGESTION_WINDOW_SIZE = 20
+CONGESTION_MAX_AGE_SECONDS = 3600
+CONGESTION_FACTOR = 5.0
+CONGESTION_WARN_THRESHOLD = 0.9
+
+# SDK-level retries for read-only list calls (transient 5xx / 429)
+LIST_RETRY_STRATEGY = oci.retry.RetryStrategyBuilder(
+    max_attempts_check=True,
+    max_attempts=5,
+    total_elapsed_time_check=True,
+    total_elapsed_time_seconds=60,
+    retry_max_wait_between_calls_seconds=8,
+    retry_base_sleep_time_seconds=1,
+    backoff_type=oci.retry.BACKOFF_EQUAL_JITTER_VALUE,
+).add_service_error_check(
+    service_error_retry_on_any_5xx=True,
+    service_error_retry_config={429: []},
+).get_retry_strategy()
+
+# SDK-level retries for launch_instance, which re-send the same request (and
+# opc-retry-token). Only timeouts, connection errors and gateway errors are
+# retried - cases where the launch may have been accepted without a response.
+# 500 InternalError ("Out of host capacity") and 429 are definite answers and
+# are handled by the main loop's backoff instead.
+LAUNCH_RETRY_STRATEGY = oci.retry.RetryStrategyBuilder(
+    max_attempts_check=True,
+    max_attempts=3,
+    total_elapsed_time_check=True,
+    total_elapsed_time_seconds=60,
+    retry_max_wait_between_calls_seconds=8,
+    retry_base_sleep_time_seconds=1,
+    backoff_type=oci.retry.BACKOFF_EQUAL_JITTER_VALUE,
+).add_service_error_check(
+    service_error_retry_on_any_5xx=False,
+    service_error_retry_config={502: [], 503: [], 504: []},
+).get_retry_strategy()
+
+# ANSI escape sequences (colorama codes) stripped from file logs
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
 
 # Ensure logs directory exists
 LOG_DIR.mkdir(exist_ok=True)
@@ -54,27 +130,39 @@ class StripColorFormatter(logging.Formatter):
     """Formatter that strips ANSI color codes from log messages."""
     
     def format(self, record):
-        # Strip colorama codes from the message
-        if hasattr(record, 'msg'):
-            # Remove ANSI escape sequences
-            import re
-            ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-            record.msg = ansi_escape.sub('', str(record.msg))
-        return super().format(record)
+        # Strip from the formatted output rather than record.msg, so other
+        # handlers sharing the record still see the original message
+        formatted = super().format(record)
+        if '\x1b' in formatted:
+            formatted = _ANSI_RE.sub('', formatted)
+        return formatted
 
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
     """Set up logging configuration."""
     log_level = logging.DEBUG if verbose else logging.INFO
     
-    # File handler - always detailed, strips colors
-    file_handler = logging.FileHandler(LOG_FILE)
-    file_handler.setLevel(logging.DEBUG)
-    file_formatter = StripColorFormatter(
+    # File handler - always detailed, strips colors (nothing to strip without colorama).
+    # Rotated by size, opened on first write, and buffered so records are written
+    # in batches; WARNING+ and interpreter exit (logging.shutdown) flush the buffer.
+    rotating_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        delay=True,
+    )
+    file_formatter_class = StripColorFormatter if HAS_COLOR else logging.Formatter
+    file_formatter = file_formatter_class(
         '%(asctime)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    file_handler.setFormatter(file_formatter)
+    rotating_handler.setFormatter(file_formatter)
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=rotating_handler,
+    )
+    file_handler.setLevel(logging.DEBUG)
     
     # Console handler - respects verbosity, keeps colors
     console_handler = logging.StreamHandler()
@@ -91,64 +179,95 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     return logger
 
 
-def load_config() -> Dict[str, str]:
-    """Load configuration from .env file."""
-    env_path = PROJECT_ROOT / ".env"
-    if not env_path.exists():
-        print(f"{Fore.RED}ERROR: .env file not found!")
-        print(f"{Fore.YELLOW}Run: cp .env.example .env")
-        print(f"{Fore.YELLOW}Then fill in your OCI details.")
-        sys.exit(1)
-    
-    load_dotenv(env_path)
+@dataclass(frozen=True)
+class HunterConfig:
+    """Configuration loaded from .env, with numeric fields already parsed."""
+    user: Optional[str]
+    tenancy: Optional[str]
+    region: Optional[str]
+    fingerprint: Optional[str]
+    key_file: Optional[str]
+    compartment: Optional[str]
+    display_name: str
+    availability_domain: Optional[str]
+    shape: str
+    ocpus: float
+    memory: float
+    subnet: Optional[str]
+    image: Optional[str]
+    ssh_key_file: Optional[str]
+    boot_volume_size: int
+
+
+def _env_number(name: str, default: str, convert):
+    """Read a numeric environment variable, naming the variable on bad input."""
+    value = os.getenv(name, default)
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+
+
+def load_config() -> HunterConfig:
+    """Load configuration from .env file, unless already present in the environment."""
+    # Scheduled runs can provide the settings directly (e.g. systemd
+    # EnvironmentFile=, or sourcing .env in the cron command), which is the
+    # preferred mode: .env is then not parsed again on every run.
+    if os.getenv('OCI_TENANCY_OCID') is None:
+        env_path = PROJECT_ROOT / ".env"
+        if not env_path.exists():
+            print(f"{Fore.RED}ERROR: .env file not found!")
+            print(f"{Fore.YELLOW}Run: cp .env.example .env")
+            print(f"{Fore.YELLOW}Then fill in your OCI details.")
+            sys.exit(1)
+        
+        load_dotenv(env_path)
     
     # Load all configuration
-    config = {
-        'user': os.getenv('OCI_USER_OCID'),
-        'tenancy': os.getenv('OCI_TENANCY_OCID'),
-        'region': os.getenv('OCI_REGION'),
-        'fingerprint': os.getenv('OCI_FINGERPRINT'),
-        'key_file': os.getenv('OCI_KEY_FILE'),
-        'compartment': os.getenv('OCI_COMPARTMENT_OCID'),
-        'display_name': os.getenv('INSTANCE_DISPLAY_NAME', 'my-always-free-instance'),
-        'availability_domain': os.getenv('AVAILABILITY_DOMAIN'),
-        'shape': os.getenv('INSTANCE_SHAPE', 'VM.Standard.A1.Flex'),
-        'ocpus': os.getenv('INSTANCE_OCPUS', '4'),
-        'memory': os.getenv('INSTANCE_MEMORY_IN_GBS', '24'),
-        'subnet': os.getenv('SUBNET_OCID'),
-        'image': os.getenv('IMAGE_OCID'),
-        'ssh_key_file': os.getenv('SSH_PUBLIC_KEY_FILE'),
-        'boot_volume_size': os.getenv('BOOT_VOLUME_SIZE_IN_GBS', '50'),
-    }
-    
-    return config
+    return HunterConfig(
+        user=os.getenv('OCI_USER_OCID'),
+        tenancy=os.getenv('OCI_TENANCY_OCID'),
+        region=os.getenv('OCI_REGION'),
+        fingerprint=os.getenv('OCI_FINGERPRINT'),
+        key_file=os.getenv('OCI_KEY_FILE'),
+        compartment=os.getenv('OCI_COMPARTMENT_OCID'),
+        display_name=os.getenv('INSTANCE_DISPLAY_NAME', 'my-always-free-instance'),
+        availability_domain=os.getenv('AVAILABILITY_DOMAIN'),
+        shape=os.getenv('INSTANCE_SHAPE', 'VM.Standard.A1.Flex'),
+        ocpus=_env_number('INSTANCE_OCPUS', '4', float),
+        memory=_env_number('INSTANCE_MEMORY_IN_GBS', '24', float),
+        subnet=os.getenv('SUBNET_OCID'),
+        image=os.getenv('IMAGE_OCID'),
+        ssh_key_file=os.getenv('SSH_PUBLIC_KEY_FILE'),
+        boot_volume_size=_env_number('BOOT_VOLUME_SIZE_IN_GBS', '50', int),
+    )
 
 
-def create_oci_config(config: Dict[str, str]) -> dict:
+def create_oci_config(config: HunterConfig) -> dict:
     """Create OCI SDK config from environment variables."""
-    key_file_path = Path(config['key_file'])
+    key_file_path = Path(config.key_file)
     if not key_file_path.is_absolute():
         key_file_path = PROJECT_ROOT / key_file_path
     
     return {
-        'user': config['user'],
-        'tenancy': config['tenancy'],
-        'region': config['region'],
-        'fingerprint': config['fingerprint'],
+        'user': config.user,
+        'tenancy': config.tenancy,
+        'region': config.region,
+        'fingerprint': config.fingerprint,
         'key_file': str(key_file_path),
     }
 
 
-def load_ssh_public_key(config: Dict[str, str]) -> str:
+def load_ssh_public_key(config: HunterConfig) -> str:
     """Load SSH public key from file."""
-    ssh_key_path = Path(config['ssh_key_file'])
+    ssh_key_path = Path(config.ssh_key_file)
     if not ssh_key_path.is_absolute():
         ssh_key_path = PROJECT_ROOT / ssh_key_path
     
-    if not ssh_key_path.exists():
-        raise FileNotFoundError(f"SSH public key not found: {ssh_key_path}")
-    
-    return ssh_key_path.read_text().strip()
+    try:
+        return ssh_key_path.read_text().strip()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"SSH public key not found: {ssh_key_path}") from None
 
 
 def check_if_instance_exists(
@@ -161,21 +280,23 @@ def check_if_instance_exists(
     logger.debug(f"Checking for existing instance: {display_name}")
     
     try:
-        instances = compute_client.list_instances(
+        # Newest first, fetched page by page, so the scan stops at the first
+        # active match instead of materializing every same-named instance
+        instances = oci.pagination.list_call_get_all_results_generator(
+            compute_client.list_instances,
+            'record',
             compartment_id=compartment_id,
-            display_name=display_name
-        ).data
-        
-        # Filter for non-terminated instances
-        active_instances = [
-            i for i in instances 
-            if i.lifecycle_state not in ['TERMINATED', 'TERMINATING']
-        ]
-        
-        if active_instances:
-            return active_instances[0]
+            display_name=display_name,
+            sort_by='TIMECREATED',
+            sort_order='DESC',
+            retry_strategy=LIST_RETRY_STRATEGY,
+        )
         
-        return None
+        # First non-terminated instance, if any
+        return next(
+            (i for i in instances if i.lifecycle_state not in ('TERMINATED', 'TERMINATING')),
+            None
+        )
     except Exception as e:
         logger.error(f"Error checking for existing instance: {e}")
         return None
@@ -191,7 +312,8 @@ def get_all_availability_domains(
     
     try:
         ads = identity_client.list_availability_domains(
-            compartment_id=compartment_id
+            compartment_id=compartment_id,
+            retry_strategy=LIST_RETRY_STRATEGY
         ).data
         
         ad_names = [ad.name for ad in ads]
@@ -214,7 +336,8 @@ def get_fault_domains(
     try:
         fds = identity_client.list_fault_domains(
             compartment_id=compartment_id,
-            availability_domain=availability_domain
+            availability_domain=availability_domain,
+            retry_strategy=LIST_RETRY_STRATEGY
         ).data
         
         fd_names = [fd.name for fd in fds]
@@ -225,96 +348,272 @@ def get_fault_domains(
         return []
 
 
+def get_fault_domains_by_ad(
+    identity_client: oci.identity.IdentityClient,
+    compartment_id: str,
+    availability_domains: List[str],
+    logger: logging.Logger
+) -> Dict[str, List[str]]:
+    """Fetch fault domains for all availability domains concurrently."""
+    if not availability_domains:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(availability_domains)) as executor:
+        futures = {
+            ad: executor.submit(get_fault_domains, identity_client, compartment_id, ad, logger)
+            for ad in availability_domains
+        }
+    
+    return {ad: future.result() for ad, future in futures.items()}
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds) from a response, if present."""
+    if not headers:
+        return None
+    
+    value = headers.get('retry-after') or headers.get('Retry-After')
+    if value is None:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def load_state(logger: logging.Logger) -> Tuple[deque, bool]:
+    """
+    Load state persisted by previous runs.
+    
+    Returns the recent (timestamp, outcome) pairs, without those older than
+    CONGESTION_MAX_AGE_SECONDS, and whether the congestion hint was shown.
+    """
+    window = deque(maxlen=CONGESTION_WINDOW_SIZE)
+    
+    if not STATE_FILE.exists():
+        return window, False
+    
+    try:
+        state = json.loads(STATE_FILE.read_text())
+        cutoff = time.time() - CONGESTION_MAX_AGE_SECONDS
+        for entry in state.get('outcomes', []):
+            # Entries without a timestamp predate ageing and are dropped
+            if (isinstance(entry, list) and len(entry) == 2
+                    and entry[1] in ('capacity', 'success') and entry[0] >= cutoff):
+                window.append((entry[0], entry[1]))
+        logger.debug(f"Loaded {len(window)} recent outcomes from {STATE_FILE}")
+        return window, bool(state.get('congestion_warned', False))
+    except Exception as e:
+        logger.warning(f"Could not read state file: {e}")
+        return window, False
+
+
+def save_state(window: deque, congestion_warned: bool, logger: logging.Logger):
+    """Persist recent launch outcomes so the next run inherits them."""
+    try:
+        STATE_FILE.write_text(json.dumps({
+            'outcomes': list(window),
+            'congestion_warned': congestion_warned,
+        }))
+    except Exception as e:
+        logger.warning(f"Could not write state file: {e}")
+
+
+def capacity_failure_rate(window: deque) -> float:
+    """Fraction of recent launch outcomes that were capacity errors.
+    
+    Returns 0.0 until the window is full so a handful of early failures
+    doesn't trigger the congestion factor or warning.
+    """
+    if len(window) < CONGESTION_WINDOW_SIZE:
+        return 0.0
+    return sum(1 for _, o in window if o == 'capacity') / len(window)
+
+
+def acquire_run_lock(logger: logging.Logger) -> bool:
+    """Create the lock file; False if another run holds it."""
+    try:
+        if time.time() - LOCK_FILE.stat().st_mtime > LOCK_STALE_SECONDS:
+            logger.warning(f"Removing stale lock file: {LOCK_FILE}")
+            LOCK_FILE.unlink()
+    except FileNotFoundError:
+        pass
+    
+    try:
+        fd = os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    
+    with os.fdopen(fd, 'w') as f:
+        f.write(f"{os.getpid()}\n")
+    return True
+
+
+def release_run_lock():
+    """Remove the lock file created by acquire_run_lock."""
+    try:
+        LOCK_FILE.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def compute_backoff_delay(
+    capacity_streak: int,
+    failure_rate: float = 0.0,
+    retry_after: Optional[float] = None
+) -> float:
+    """
+    Compute the delay before the next launch attempt.
+    
+    Exponential backoff with jitter, driven by the number of consecutive
+    capacity errors and widened by the recent capacity failure rate.
+    A server-provided Retry-After value acts as a floor.
+    """
+    exponent = min(capacity_streak, BACKOFF_MAX_EXPONENT)
+    jitter = 1 + random.uniform(-BACKOFF_JITTER, BACKOFF_JITTER)
+    congestion = 1 + CONGESTION_FACTOR * failure_rate
+    delay = min(
+        BACKOFF_MAX_SECONDS,
+        BACKOFF_BASE_SECONDS * congestion * (2 ** exponent) * jitter
+    )
+    
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    
+    return delay
+
+
+def classify_service_error(
+    status: Optional[int],
+    code: Optional[str],
+    message: Optional[str]
+) -> str:
+    """Map an OCI service error to 'capacity', 'throttled', 'quota' or 'other'."""
+    # Rate limiting is transient; retry after the server's Retry-After
+    if status == 429 or code == 'TooManyRequests':
+        return 'throttled'
+    
+    error_type = ERROR_CODE_MAP.get(code)
+    if error_type:
+        return error_type
+    
+    # Unknown or missing code - fall back to the message text
+    error_msg = str(message).lower()
+    if 'capacity' in error_msg:
+        return 'capacity'
+    if 'quota' in error_msg or 'limit' in error_msg:
+        return 'quota'
+    return 'other'
+
+
+def build_instance_template(config: HunterConfig, ssh_public_key: str) -> LaunchInstanceDetails:
+    """
+    Build the launch request shared by every attempt.
+    
+    Only availability_domain and fault_domain change between attempts, so they
+    are left unset here and filled in by create_instance().
+    """
+    instance_details = LaunchInstanceDetails()
+    instance_details.compartment_id = config.compartment
+    instance_details.display_name = config.display_name
+    instance_details.shape = config.shape
+    
+    # Shape config for flex shapes
+    if 'Flex' in config.shape:
+        shape_config = LaunchInstanceShapeConfigDetails()
+        shape_config.ocpus = config.ocpus
+        shape_config.memory_in_gbs = config.memory
+        instance_details.shape_config = shape_config
+    
+    # Source image
+    source_details = InstanceSourceViaImageDetails()
+    source_details.image_id = config.image
+    source_details.boot_volume_size_in_gbs = config.boot_volume_size
+    instance_details.source_details = source_details
+    
+    # Network details
+    vnic_details = CreateVnicDetails()
+    vnic_details.subnet_id = config.subnet
+    vnic_details.assign_public_ip = True
+    instance_details.create_vnic_details = vnic_details
+    
+    # SSH key
+    instance_details.metadata = {
+        'ssh_authorized_keys': ssh_public_key
+    }
+    
+    return instance_details
+
+
 def create_instance(
     compute_client: oci.core.ComputeClient,
-    config: Dict[str, str],
-    ssh_public_key: str,
+    instance_details: LaunchInstanceDetails,
     availability_domain: str,
     fault_domain: Optional[str],
     logger: logging.Logger
-) -> tuple[bool, Optional[object], Optional[str]]:
+) -> tuple[bool, Optional[object], Optional[str], Optional[float]]:
     """
     Attempt to create an instance.
     
+    instance_details is the template from build_instance_template(); its
+    availability_domain and fault_domain are overwritten for this attempt.
+    
     Returns:
-        (success, instance, error_type)
-        error_type can be: 'capacity', 'quota', 'other', None
+        (success, instance, error_type, retry_after)
+        error_type can be: 'capacity', 'throttled', 'quota', 'other', None
+        retry_after is the server-requested delay in seconds, if any
     """
     logger.info(f"Attempting to create instance in {availability_domain}" + 
                 (f" / {fault_domain}" if fault_domain else ""))
     
     try:
-        # Build instance details
-        instance_details = LaunchInstanceDetails()
         instance_details.availability_domain = availability_domain
-        instance_details.compartment_id = config['compartment']
-        instance_details.display_name = config['display_name']
-        instance_details.shape = config['shape']
-        
-        # Shape config for flex shapes
-        if 'Flex' in config['shape']:
-            shape_config = LaunchInstanceShapeConfigDetails()
-            shape_config.ocpus = float(config['ocpus'])
-            shape_config.memory_in_gbs = float(config['memory'])
-            instance_details.shape_config = shape_config
-        
-        # Source image
-        source_details = InstanceSourceViaImageDetails()
-        source_details.image_id = config['image']
-        source_details.boot_volume_size_in_gbs = int(config['boot_volume_size'])
-        instance_details.source_details = source_details
-        
-        # Network details
-        vnic_details = CreateVnicDetails()
-        vnic_details.subnet_id = config['subnet']
-        vnic_details.assign_public_ip = True
-        instance_details.create_vnic_details = vnic_details
+        instance_details.fault_domain = fault_domain or None
         
-        # SSH key
-        instance_details.metadata = {
-            'ssh_authorized_keys': ssh_public_key
-        }
-        
-        # Fault domain (if specified)
-        if fault_domain:
-            instance_details.fault_domain = fault_domain
-        
-        # Launch instance
-        logger.debug("Sending launch instance request...")
-        response = compute_client.launch_instance(instance_details)
+        # Launch instance. The SDK re-sends this request with the same retry
+        # token on timeouts/gateway errors, so OCI launches it at most once.
+        retry_token = uuid.uuid4().hex
+        logger.debug(f"Sending launch instance request (retry token {retry_token})...")
+        response = compute_client.launch_instance(
+            instance_details,
+            opc_retry_token=retry_token,
+            retry_strategy=LAUNCH_RETRY_STRATEGY,
+        )
         instance = response.data
         
-        logger.info(f"{Fore.GREEN}✓ Instance creation initiated!")
-        logger.info(f"  Instance ID: {instance.id}")
-        logger.info(f"  State: {instance.lifecycle_state}")
-        logger.info(f"  AD: {availability_domain}")
+        lines = [
+            f"{Fore.GREEN}✓ Instance creation initiated!{Style.RESET_ALL}",
+            f"  Instance ID: {instance.id}",
+            f"  State: {instance.lifecycle_state}",
+            f"  AD: {availability_domain}",
+        ]
         if fault_domain:
-            logger.info(f"  FD: {fault_domain}")
+            lines.append(f"  FD: {fault_domain}")
+        logger.info("\n".join(lines))
         
-        return True, instance, None
+        return True, instance, None, None
         
     except oci.exceptions.ServiceError as e:
-        error_msg = str(e.message).lower()
-        error_code = e.code
+        error_type = classify_service_error(e.status, e.code, e.message)
         
-        # Categorize error
-        if 'capacity' in error_msg or 'out of host capacity' in error_msg:
-            error_type = 'capacity'
+        if error_type == 'capacity':
             logger.warning(f"Capacity error in {availability_domain}" + 
                           (f" / {fault_domain}" if fault_domain else ""))
             logger.debug(f"Error details: {e.message}")
-        elif 'quota' in error_msg or 'limit' in error_msg:
-            error_type = 'quota'
+        elif error_type == 'throttled':
+            logger.warning(f"Rate limited by OCI in {availability_domain}" +
+                          (f" / {fault_domain}" if fault_domain else ""))
+        elif error_type == 'quota':
             logger.error(f"Quota/limit error: {e.message}")
         else:
-            error_type = 'other'
-            logger.error(f"Service error [{error_code}]: {e.message}")
+            logger.error(f"Service error [{e.code}]: {e.message}")
         
-        return False, None, error_type
+        return False, None, error_type, parse_retry_after(getattr(e, 'headers', None))
         
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
-        return False, None, 'other'
+        return False, None, 'other', None
 
 
 def create_success_flag(instance_id: str, logger: logging.Logger):
@@ -326,6 +625,14 @@ def create_success_flag(instance_id: str, logger: logging.Logger):
         logger.warning(f"Could not create flag file: {e}")
 
 
+def read_success_flag() -> Optional[List[str]]:
+    """Read the flag file's lines, or return None if it does not exist."""
+    try:
+        return FLAG_FILE.read_text().strip().split('\n')
+    except FileNotFoundError:
+        return None
+
+
 def main():
     """Main execution flow."""
     import argparse
@@ -337,6 +644,8 @@ def main():
                        help='Enable verbose logging')
     parser.add_argument('--no-cycle', action='store_true',
                        help='Do not cycle through ADs, only use the one in .env')
+    parser.add_argument('--per-fd', action='store_true',
+                       help='Also try each fault domain after an AD-level capacity error')
     parser.add_argument('--dry-run', action='store_true',
                        help='Validate configuration without creating instance')
     parser.add_argument('--force', action='store_true',
@@ -346,35 +655,54 @@ def main():
     
     # Setup
     logger = setup_logging(verbose=args.verbose)
-    logger.info("="*60)
-    logger.info("OCI Instance Hunter - Starting")
-    logger.info("="*60)
-    
-    # Check flag file
-    if FLAG_FILE.exists() and not args.force:
-        instance_info = FLAG_FILE.read_text().strip().split('\n')
-        logger.info(f"{Fore.GREEN}✓ Instance already created!")
+    logger.info("\n".join(["="*60, "OCI Instance Hunter - Starting", "="*60]))
+    
+    # Check flag file (not even read under --force)
+    instance_info = None if args.force else read_success_flag()
+    if instance_info is not None:
+        lines = [f"{Fore.GREEN}✓ Instance already created!{Style.RESET_ALL}"]
         if instance_info:
-            logger.info(f"  Instance ID: {instance_info[0]}")
+            lines.append(f"  Instance ID: {instance_info[0]}")
             if len(instance_info) > 1:
-                logger.info(f"  Created at: {instance_info[1]}")
-        logger.info(f"  Flag file: {FLAG_FILE}")
-        logger.info("\nTo create another instance, delete the flag file:")
-        logger.info(f"  rm {FLAG_FILE}")
+                lines.append(f"  Created at: {instance_info[1]}")
+        lines += [
+            f"  Flag file: {FLAG_FILE}",
+            "\nTo create another instance, delete the flag file:",
+            f"  rm {FLAG_FILE}",
+        ]
+        logger.info("\n".join(lines))
+        return 0
+    
+    # One run at a time, so overlapping scheduled runs can't both launch
+    if not acquire_run_lock(logger):
+        logger.warning(f"Another run is in progress (lock file: {LOCK_FILE}), exiting")
         return 0
     
+    try:
+        return run_hunter(args, logger)
+    finally:
+        release_run_lock()
+
+
+def run_hunter(args, logger: logging.Logger) -> int:
+    """Load the configuration and make launch attempts; returns the exit code."""
     # Load configuration
     logger.info("Loading configuration...")
-    config = load_config()
+    try:
+        config = load_config()
+    except ValueError as e:
+        logger.error(f"Invalid configuration: {e}")
+        return 1
     oci_config = create_oci_config(config)
     
-    logger.info(f"Region: {config['region']}")
-    logger.info(f"Shape: {config['shape']}")
-    logger.info(f"Display Name: {config['display_name']}")
+    logger.info("\n".join([
+        f"Region: {config.region}",
+        f"Shape: {config.shape}",
+        f"Display Name: {config.display_name}",
+    ]))
     
     if args.dry_run:
-        logger.info("")
-        logger.info(Fore.YELLOW + "DRY RUN MODE - No instance will be created")
+        logger.info(f"\n{Fore.YELLOW}DRY RUN MODE - No instance will be created{Style.RESET_ALL}")
     
     # Load SSH key
     try:
@@ -384,6 +712,8 @@ def main():
         logger.error(f"SSH key error: {e}")
         return 1
     
+    instance_template = build_instance_template(config, ssh_public_key)
+    
     # Initialize OCI clients
     logger.info("Initializing OCI clients...")
     try:
@@ -398,16 +728,18 @@ def main():
     logger.info("Checking for existing instance...")
     existing_instance = check_if_instance_exists(
         compute_client,
-        config['compartment'],
-        config['display_name'],
+        config.compartment,
+        config.display_name,
         logger
     )
     
     if existing_instance:
-        logger.info(f"{Fore.GREEN}✓ Instance already exists!")
-        logger.info(f"  Instance ID: {existing_instance.id}")
-        logger.info(f"  State: {existing_instance.lifecycle_state}")
-        logger.info(f"  AD: {existing_instance.availability_domain}")
+        logger.info("\n".join([
+            f"{Fore.GREEN}✓ Instance already exists!{Style.RESET_ALL}",
+            f"  Instance ID: {existing_instance.id}",
+            f"  State: {existing_instance.lifecycle_state}",
+            f"  AD: {existing_instance.availability_domain}",
+        ]))
         
         # Create flag file if it doesn't exist
         if not FLAG_FILE.exists():
@@ -416,21 +748,23 @@ def main():
         return 0
     
     if args.dry_run:
-        logger.info(f"\n{Fore.GREEN}✓ Dry run successful - configuration looks good!")
-        logger.info("Remove --dry-run flag to actually create the instance")
+        logger.info("\n".join([
+            f"\n{Fore.GREEN}✓ Dry run successful - configuration looks good!{Style.RESET_ALL}",
+            "Remove --dry-run flag to actually create the instance",
+        ]))
         return 0
     
     # Get availability domains to try
     if args.no_cycle:
         # Use only the specified AD (or first one if not specified)
-        if config['availability_domain']:
-            availability_domains = [config['availability_domain']]
-            logger.info(f"Using only specified availability domain: {config['availability_domain']}")
+        if config.availability_domain:
+            availability_domains = [config.availability_domain]
+            logger.info(f"Using only specified availability domain: {config.availability_domain}")
         else:
             # Get all ADs but only use the first one
             all_ads = get_all_availability_domains(
                 identity_client,
-                config['compartment'],
+                config.compartment,
                 logger
             )
             if not all_ads:
@@ -442,7 +776,7 @@ def main():
         # Get all ADs and cycle through them
         availability_domains = get_all_availability_domains(
             identity_client,
-            config['compartment'],
+            config.compartment,
             logger
         )
         
@@ -453,95 +787,153 @@ def main():
         logger.info(f"Will cycle through all {len(availability_domains)} availability domains")
     
     # Try to create instance across ADs and FDs
-    logger.info("")
-    logger.info("="*60)
-    logger.info("Starting instance creation attempts...")
-    logger.info("="*60)
-    logger.info("")
+    logger.info("\n".join(["", "="*60, "Starting instance creation attempts...", "="*60, ""]))
     
     total_attempts = 0
     capacity_errors = 0
-    
-    for ad in availability_domains:
-        # Get fault domains for this AD
-        fault_domains = get_fault_domains(
+    capacity_streak = 0
+    next_delay = 0.0
+    slept = 0.0
+    budget_exhausted = False
+    outcomes, congestion_warned = load_state(logger)
+    
+    # Capacity is checked per AD, so an attempt without a fault domain already
+    # covers every FD in it. Fault domains are only needed when retrying per FD.
+    if args.per_fd:
+        fd_by_ad = get_fault_domains_by_ad(
             identity_client,
-            config['compartment'],
-            ad,
+            config.compartment,
+            availability_domains,
             logger
         )
+    else:
+        logger.debug("Trying each AD once, skipping per-FD retries (use --per-fd to enable)")
+        fd_by_ad = {}
+    
+    # Launch attempts are deliberately sequential. An in-flight launch_instance
+    # request cannot be cancelled, so racing several ADs could create more than
+    # one instance and use up the Always Free quota.
+    for ad in availability_domains:
+        fault_domains = fd_by_ad.get(ad, [])
         
         # Try without specifying fault domain first
-        attempts = [None] + fault_domains
-        
-        for fd in attempts:
+        for fd in chain((None,), fault_domains):
+            # Back off before every attempt except the first
+            if next_delay > 0:
+                if slept + next_delay > RUN_SLEEP_BUDGET_SECONDS:
+                    budget_exhausted = True
+                    break
+                logger.debug(f"Waiting {next_delay:.1f}s before next attempt")
+                time.sleep(next_delay)
+                slept += next_delay
+            
             total_attempts += 1
             
-            success, instance, error_type = create_instance(
+            success, instance, error_type, retry_after = create_instance(
                 compute_client,
-                config,
-                ssh_public_key,
+                instance_template,
                 ad,
                 fd,
                 logger
             )
             
             if success:
-                # Success!
-                logger.info("")
-                logger.info(Fore.GREEN + "="*60)
-                logger.info(Fore.GREEN + "✓ INSTANCE CREATED SUCCESSFULLY!")
-                logger.info(Fore.GREEN + "="*60)
-                logger.info("")
-                logger.info(f"Instance ID: {Fore.YELLOW}{instance.id}")
-                logger.info(f"Availability Domain: {Fore.YELLOW}{ad}")
+                outcomes.append((time.time(), 'success'))
+                save_state(outcomes, congestion_warned, logger)
+                
+                # Success! Each coloured line resets explicitly since the
+                # block is written in one go
+                lines = [
+                    "",
+                    f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}",
+                    f"{Fore.GREEN}✓ INSTANCE CREATED SUCCESSFULLY!{Style.RESET_ALL}",
+                    f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}",
+                    "",
+                    f"Instance ID: {Fore.YELLOW}{instance.id}{Style.RESET_ALL}",
+                    f"Availability Domain: {Fore.YELLOW}{ad}{Style.RESET_ALL}",
+                ]
                 if fd:
-                    logger.info(f"Fault Domain: {Fore.YELLOW}{fd}")
-                logger.info(f"\nTotal attempts: {total_attempts}")
-                logger.info(f"Capacity errors encountered: {capacity_errors}")
+                    lines.append(f"Fault Domain: {Fore.YELLOW}{fd}{Style.RESET_ALL}")
+                lines += [
+                    "",
+                    f"Total attempts: {total_attempts}",
+                    f"Capacity errors encountered: {capacity_errors}",
+                ]
+                logger.info("\n".join(lines))
                 
                 # Create flag file
                 create_success_flag(instance.id, logger)
                 
-                logger.info("")
-                logger.info(f"{Fore.CYAN}Next steps:")
-                logger.info("1. Wait for instance to finish provisioning (check OCI console)")
-                logger.info("2. Get the public IP from OCI console")
-                logger.info(f"3. SSH into instance: ssh -i {config['ssh_key_file'].replace('.pub', '')} ubuntu@<public-ip>")
+                logger.info("\n".join([
+                    "",
+                    f"{Fore.CYAN}Next steps:{Style.RESET_ALL}",
+                    "1. Wait for instance to finish provisioning (check OCI console)",
+                    "2. Get the public IP from OCI console",
+                    f"3. SSH into instance: ssh -i {config.ssh_key_file.replace('.pub', '')} ubuntu@<public-ip>",
+                ]))
                 
                 return 0
             
             # Track capacity errors
             if error_type == 'capacity':
                 capacity_errors += 1
+                capacity_streak += 1
+                outcomes.append((time.time(), 'capacity'))
+            elif error_type == 'throttled':
+                # Recoverable but not a capacity error: restart the capacity
+                # backoff; the wait is floored by Retry-After instead
+                capacity_streak = 0
             elif error_type in ['quota', 'other']:
                 # Non-capacity errors are likely persistent, stop trying
                 logger.error(f"\n{Fore.RED}Non-capacity error encountered. Stopping attempts.")
                 logger.error("Check the error message above and your configuration.")
                 return 1
             
-            # Small delay between attempts
-            if total_attempts < len(availability_domains) * (1 + len(fault_domains)):
-                time.sleep(1)
-    
-    # All attempts failed
-    logger.warning("")
-    logger.warning(Fore.YELLOW + "="*60)
-    logger.warning(Fore.YELLOW + "All creation attempts failed")
-    logger.warning(Fore.YELLOW + "="*60)
-    logger.warning("")
-    logger.warning(f"Total attempts: {total_attempts}")
-    logger.warning(f"Capacity errors: {capacity_errors}")
+            # Only hint when the failure rate newly crosses the threshold; the
+            # state file remembers it across scheduled runs
+            failure_rate = capacity_failure_rate(outcomes)
+            high_failure_rate = failure_rate > CONGESTION_WARN_THRESHOLD
+            if high_failure_rate and not congestion_warned:
+                logger.info("\n".join([
+                    f"{Fore.YELLOW}Capacity failure rate is {failure_rate:.0%} "
+                    f"over the last {len(outcomes)} attempts{Style.RESET_ALL}",
+                    "Consider relying on scheduled re-runs (cron / Task Scheduler) "
+                    "instead of long retry sessions",
+                ]))
+            congestion_warned = high_failure_rate
+            save_state(outcomes, congestion_warned, logger)
+            
+            next_delay = compute_backoff_delay(capacity_streak, failure_rate, retry_after)
+        
+        if budget_exhausted:
+            break
+    
+    # All attempts failed (or the rest were left to the next scheduled run)
+    lines = [
+        "",
+        f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}",
+        f"{Fore.YELLOW}All creation attempts failed{Style.RESET_ALL}",
+        f"{Fore.YELLOW}{'='*60}{Style.RESET_ALL}",
+        "",
+        f"Total attempts: {total_attempts}",
+        f"Capacity errors: {capacity_errors}",
+    ]
+    if budget_exhausted:
+        lines.append(f"Stopped early: the {RUN_SLEEP_BUDGET_SECONDS:.0f}s wait budget is used up, "
+                     "remaining attempts are left to the next scheduled run")
+    logger.warning("\n".join(lines))
     
     if capacity_errors == total_attempts:
-        logger.info("")
-        logger.info(f"{Fore.CYAN}All failures were due to capacity.")
-        logger.info("This is normal for Always Free instances.")
-        logger.info("")
-        logger.info("Recommendations:")
-        logger.info("1. Set up a scheduled task to run this script every 5-15 minutes")
-        logger.info("2. Try during off-peak hours (early morning UTC)")
-        logger.info("3. Consider trying a different region")
+        logger.info("\n".join([
+            "",
+            f"{Fore.CYAN}All failures were due to capacity.{Style.RESET_ALL}",
+            "This is normal for Always Free instances.",
+            "",
+            "Recommendations:",
+            "1. Set up a scheduled task to run this script every 5-15 minutes",
+            "2. Try during off-peak hours (early morning UTC)",
+            "3. Consider trying a different region",
+        ]))
     
     return 1
 
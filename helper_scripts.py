@@ -6,74 +6,233 @@ Utilities to help gather information from OCI and validate configuration.
 """
 
 import argparse
+import importlib.util
+import io
+import json
+import logging
+import os
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-try:
-    import oci
-    from dotenv import load_dotenv
-    import os
-except ImportError:
+# oci and dotenv are imported where they are used; only check they are installed
+if any(importlib.util.find_spec(name) is None for name in ("oci", "dotenv")):
     print("ERROR: Required packages not installed.")
     print("Run: uv sync")
     sys.exit(1)
 
+# Only color terminal output; piped or redirected output stays plain
+HAS_COLOR = False
+if sys.stdout.isatty():
+    try:
+        from colorama import init, Fore, Style
+        init(autoreset=True)
+        HAS_COLOR = True
+    except ImportError:
+        pass
+
 try:
-    from colorama import init, Fore, Style
-    init(autoreset=True)
-    HAS_COLOR = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_COLOR = False
+    HAS_ORJSON = False
+
+if not HAS_COLOR:
     class Fore:
         GREEN = RED = YELLOW = CYAN = BLUE = MAGENTA = ""
     class Style:
         BRIGHT = RESET_ALL = ""
 
 
+_MODULE_DIR = Path(__file__).resolve().parent
+
+
+class StdoutHandler(logging.Handler):
+    """Handler that writes to the current sys.stdout (or sys.stderr if to_stderr)."""
+    
+    to_stderr = False
+    
+    def emit(self, record):
+        try:
+            # Looked up per record so redirected/buffered streams are honoured
+            stream = sys.stderr if self.to_stderr else sys.stdout
+            stream.write(self.format(record) + "\n")
+            stream.flush()
+        except Exception:
+            self.handleError(record)
+
+
+# Failures are logged to stdout so they stay in order with the rest of the output;
+# --json switches them to stderr to keep stdout machine-readable
+logger = logging.getLogger('oci-instance-hunter.helpers')
+_handler = StdoutHandler()
+_handler.setFormatter(logging.Formatter(f"{Fore.RED}✗ %(message)s{Style.RESET_ALL}"))
+logger.addHandler(_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+_BAR = '=' * 60
+_BANNER_TMPL = (
+    f"\n{Fore.CYAN}{_BAR}{Style.RESET_ALL}\n"
+    f"{Fore.CYAN}{{title}}{Style.RESET_ALL}\n"
+    f"{Fore.CYAN}{_BAR}{Style.RESET_ALL}\n\n"
+)
+
+_oci = None
+_config_cache = None
+_oci_config = None
+_signer = None
+_identity_client = None
+_compute_client = None
+_client_lock = threading.Lock()
+
+# Maximum number of requested operations run concurrently
+MAX_PARALLEL_ACTIONS = 4
+
+# Number of most recent images fetched by --list-images
+MAX_IMAGES = 50
+
+# Settings checked by --validate
+REQUIRED_FIELDS = ('user', 'tenancy', 'region', 'fingerprint', 'key_file', 'compartment')
+REQUIRED_FIELD_LABELS = {field: field.upper().replace('_', ' ') for field in REQUIRED_FIELDS}
+REQUIRED_ENV_VARS = (
+    'INSTANCE_DISPLAY_NAME',
+    'AVAILABILITY_DOMAIN',
+    'INSTANCE_SHAPE',
+    'SUBNET_OCID',
+    'IMAGE_OCID',
+)
+
+
+def print_banner(title: str):
+    """Print a section banner in a single write."""
+    sys.stdout.write(_BANNER_TMPL.format(title=title))
+
+
+def write_json(data):
+    """Write data to stdout as one line of JSON (orjson if installed)."""
+    if HAS_ORJSON:
+        text = orjson.dumps(data).decode()
+    else:
+        text = json.dumps(data)
+    sys.stdout.write(text + "\n")
+
+
+def _get_oci():
+    """Import the OCI SDK on first use."""
+    global _oci
+    if _oci is None:
+        import oci
+        _oci = oci
+    return _oci
+
+
+def _resolve_path(value: Optional[str]) -> Optional[str]:
+    """Resolve a path setting relative to the project directory."""
+    if not value:
+        return value
+    path = Path(value)
+    if not path.is_absolute():
+        path = _MODULE_DIR / path
+    return str(path)
+
+
 def load_config():
-    """Load configuration from .env file."""
-    env_path = Path(__file__).parent / ".env"
+    """Load configuration from .env file (parsed once per process)."""
+    global _config_cache
+    if _config_cache is not None:
+        return _config_cache
+    
+    from dotenv import load_dotenv
+    
+    env_path = _MODULE_DIR / ".env"
     if not env_path.exists():
         print(f"{Fore.RED}ERROR: .env file not found!")
         print(f"{Fore.YELLOW}Copy .env.example to .env and fill in your details.")
         sys.exit(1)
     
     load_dotenv(env_path)
-    return {
-        'user': os.getenv('OCI_USER_OCID'),
-        'tenancy': os.getenv('OCI_TENANCY_OCID'),
-        'region': os.getenv('OCI_REGION'),
-        'fingerprint': os.getenv('OCI_FINGERPRINT'),
-        'key_file': os.getenv('OCI_KEY_FILE'),
-        'compartment': os.getenv('OCI_COMPARTMENT_OCID'),
+    env = os.environ
+    _config_cache = {
+        'user': env.get('OCI_USER_OCID'),
+        'tenancy': env.get('OCI_TENANCY_OCID'),
+        'region': env.get('OCI_REGION'),
+        'fingerprint': env.get('OCI_FINGERPRINT'),
+        'key_file': _resolve_path(env.get('OCI_KEY_FILE')),
+        'compartment': env.get('OCI_COMPARTMENT_OCID'),
+        'ssh_key_file': _resolve_path(env.get('SSH_PUBLIC_KEY_FILE')),
     }
+    return _config_cache
 
 
 def create_oci_config(config: dict) -> dict:
-    """Create OCI SDK config from environment variables."""
-    key_file_path = Path(config['key_file'])
-    if not key_file_path.is_absolute():
-        key_file_path = Path(__file__).parent / key_file_path
+    """Create OCI SDK config from environment variables (built once per process)."""
+    global _oci_config
+    if _oci_config is not None:
+        return _oci_config
+    
+    missing = [REQUIRED_FIELD_LABELS[field] for field in REQUIRED_FIELDS if not config.get(field)]
+    if missing:
+        raise ValueError(f"Missing {', '.join(missing)}")
     
-    return {
+    _oci_config = {
         'user': config['user'],
         'tenancy': config['tenancy'],
         'region': config['region'],
         'fingerprint': config['fingerprint'],
-        'key_file': str(key_file_path),
+        'key_file': config['key_file'],
     }
+    return _oci_config
+
+
+def _get_signer(config: dict):
+    """Return the request signer shared by all clients (call with _client_lock held)."""
+    global _signer
+    if _signer is None:
+        oci_config = create_oci_config(config)
+        _signer = _get_oci().signer.Signer(
+            tenancy=oci_config['tenancy'],
+            user=oci_config['user'],
+            fingerprint=oci_config['fingerprint'],
+            private_key_file_location=oci_config['key_file'],
+        )
+    return _signer
+
+
+def get_identity_client(config: dict):
+    """Return the shared IdentityClient, creating it on first use."""
+    global _identity_client
+    with _client_lock:
+        if _identity_client is None:
+            _identity_client = _get_oci().identity.IdentityClient(
+                create_oci_config(config), signer=_get_signer(config)
+            )
+    return _identity_client
+
+
+def get_compute_client(config: dict):
+    """Return the shared ComputeClient, creating it on first use."""
+    global _compute_client
+    with _client_lock:
+        if _compute_client is None:
+            _compute_client = _get_oci().core.ComputeClient(
+                create_oci_config(config), signer=_get_signer(config)
+            )
+    return _compute_client
 
 
 def test_authentication(config: dict) -> bool:
     """Test OCI authentication."""
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}Testing OCI Authentication...")
-    print(f"{Fore.CYAN}{'='*60}\n")
+    oci = _get_oci()
+    
+    print_banner("Testing OCI Authentication...")
     
     try:
-        oci_config = create_oci_config(config)
-        identity_client = oci.identity.IdentityClient(oci_config)
+        identity_client = get_identity_client(config)
         
         # Test by getting user details
         user = identity_client.get_user(config['user']).data
@@ -84,35 +243,37 @@ def test_authentication(config: dict) -> bool:
         
         return True
     except oci.exceptions.ConfigFileNotFound as e:
-        print(f"{Fore.RED}✗ Config file not found: {e}")
+        logger.error("Config file not found: %s", e)
         return False
     except oci.exceptions.InvalidPrivateKey as e:
-        print(f"{Fore.RED}✗ Invalid private key: {e}")
+        logger.error("Invalid private key: %s", e)
         print(f"{Fore.YELLOW}  Check that OCI_KEY_FILE path is correct")
         return False
     except oci.exceptions.ServiceError as e:
-        print(f"{Fore.RED}✗ Service error: {e.message}")
+        logger.error("Service error: %s", e.message)
         print(f"{Fore.YELLOW}  Status: {e.status}")
         return False
     except Exception as e:
-        print(f"{Fore.RED}✗ Authentication failed: {e}")
+        logger.error("Authentication failed: %s", e)
         return False
 
 
-def list_availability_domains(config: dict):
+def list_availability_domains(config: dict, fmt: str = 'text'):
     """List all availability domains in the tenancy."""
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}Availability Domains in {config['region']}")
-    print(f"{Fore.CYAN}{'='*60}\n")
+    if fmt != 'json':
+        print_banner(f"Availability Domains in {config['region']}")
     
     try:
-        oci_config = create_oci_config(config)
-        identity_client = oci.identity.IdentityClient(oci_config)
+        identity_client = get_identity_client(config)
         
         ads = identity_client.list_availability_domains(
             compartment_id=config['compartment']
         ).data
         
+        if fmt == 'json':
+            write_json([{'name': ad.name, 'id': ad.id} for ad in ads])
+            return
+        
         if not ads:
             print(f"{Fore.YELLOW}No availability domains found.")
             return
@@ -124,157 +285,174 @@ def list_availability_domains(config: dict):
         print(f"\n{Fore.CYAN}Copy one of these to AVAILABILITY_DOMAIN in your .env file")
         
     except Exception as e:
-        print(f"{Fore.RED}✗ Failed to list availability domains: {e}")
+        logger.error("Failed to list availability domains: %s", e)
+        return False
 
 
-def list_images(config: dict, shape: Optional[str] = None, os_name: Optional[str] = None):
+def list_images(
+    config: dict,
+    shape: Optional[str] = None,
+    os_name: Optional[str] = None,
+    fmt: str = 'text'
+):
     """List available images for a given shape."""
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}Available Images")
-    print(f"{Fore.CYAN}{'='*60}\n")
-    
     shape = shape or os.getenv('INSTANCE_SHAPE', 'VM.Standard.A1.Flex')
-    print(f"Shape: {Fore.YELLOW}{shape}")
-    if os_name:
-        print(f"OS Filter: {Fore.YELLOW}{os_name}")
-    print()
+    
+    if fmt != 'json':
+        print_banner("Available Images")
+        print(f"Shape: {Fore.YELLOW}{shape}")
+        if os_name:
+            print(f"OS Filter: {Fore.YELLOW}{os_name}")
+        print()
     
     try:
-        oci_config = create_oci_config(config)
-        compute_client = oci.core.ComputeClient(oci_config)
+        compute_client = get_compute_client(config)
         
-        # List images
+        # List the most recent images compatible with the shape; OCI filters
+        # by shape and OS server-side
         list_images_kwargs = {
             'compartment_id': config['compartment'],
             'sort_by': 'TIMECREATED',
             'sort_order': 'DESC',
             'lifecycle_state': 'AVAILABLE',
+            'limit': MAX_IMAGES,
         }
         
+        if shape:
+            list_images_kwargs['shape'] = shape
+        
         if os_name:
             list_images_kwargs['operating_system'] = os_name
         
-        images = compute_client.list_images(**list_images_kwargs).data
+        images = list(islice(
+            _get_oci().pagination.list_call_get_all_results_generator(
+                compute_client.list_images, 'record', **list_images_kwargs
+            ),
+            MAX_IMAGES
+        ))
         
-        if not images:
-            print(f"{Fore.YELLOW}No images found.")
+        if fmt == 'json':
+            write_json([
+                {
+                    'id': img.id,
+                    'display_name': img.display_name,
+                    'operating_system': img.operating_system,
+                    'operating_system_version': img.operating_system_version,
+                    'size_in_mbs': img.size_in_mbs,
+                }
+                for img in images
+            ])
             return
         
-        # Filter by shape compatibility
-        compatible_images = []
-        for img in images:
-            # Check if shape is compatible (simplified - may need more checks)
-            if 'A1' in shape and 'aarch64' in img.display_name.lower():
-                compatible_images.append(img)
-            elif 'E2' in shape and 'aarch64' not in img.display_name.lower():
-                compatible_images.append(img)
-            elif not shape or 'A1' not in shape and 'E2' not in shape:
-                compatible_images.append(img)
-        
-        if not compatible_images:
+        if not images:
             print(f"{Fore.YELLOW}No compatible images found for shape {shape}")
             print(f"{Fore.YELLOW}Try a different OS filter or check shape name")
             return
         
         # Group by OS
-        os_groups = {}
-        for img in compatible_images[:50]:  # Limit to 50 most recent
-            os_key = img.operating_system
-            if os_key not in os_groups:
-                os_groups[os_key] = []
-            os_groups[os_key].append(img)
+        os_groups = defaultdict(list)
+        for img in images:
+            os_groups[img.operating_system].append(img)
         
-        for os_name, imgs in os_groups.items():
-            print(f"\n{Fore.MAGENTA}{Style.BRIGHT}{os_name}:")
-            for img in imgs[:5]:  # Show top 5 per OS
-                print(f"  {Fore.GREEN}• {img.display_name}")
-                print(f"    {Fore.CYAN}OCID: {Fore.YELLOW}{img.id}")
-                print(f"    {Fore.CYAN}Size: {img.size_in_mbs} MB")
-                print()
+        # Build the whole listing and write it at once. Lines reset their own
+        # color, since colorama's autoreset only applies per write.
+        green, cyan, yellow, reset = Fore.GREEN, Fore.CYAN, Fore.YELLOW, Style.RESET_ALL
+        heading = f"{Fore.MAGENTA}{Style.BRIGHT}"
+        lines = []
+        for os_label, imgs in os_groups.items():
+            lines.append(f"\n{heading}{os_label}:{reset}")
+            lines.extend(
+                line
+                for img in imgs[:5]  # Show top 5 per OS
+                for line in (
+                    f"  {green}• {img.display_name}{reset}",
+                    f"    {cyan}OCID: {yellow}{img.id}{reset}",
+                    f"    {cyan}Size: {img.size_in_mbs} MB{reset}",
+                    "",
+                )
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
         
         print(f"{Fore.CYAN}Copy the OCID of your preferred image to IMAGE_OCID in .env")
         
     except Exception as e:
-        print(f"{Fore.RED}✗ Failed to list images: {e}")
+        logger.error("Failed to list images: %s", e)
+        return False
 
 
-def list_shapes(config: dict):
+def list_shapes(config: dict, fmt: str = 'text'):
     """List available compute shapes."""
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}Available Compute Shapes")
-    print(f"{Fore.CYAN}{'='*60}\n")
+    if fmt != 'json':
+        print_banner("Available Compute Shapes")
     
     try:
-        oci_config = create_oci_config(config)
-        compute_client = oci.core.ComputeClient(oci_config)
+        compute_client = get_compute_client(config)
         
-        shapes = compute_client.list_shapes(
+        # Stream every page, keeping only Always Free eligible shapes
+        shapes = _get_oci().pagination.list_call_get_all_results_generator(
+            compute_client.list_shapes,
+            'record',
             compartment_id=config['compartment']
-        ).data
-        
-        # Filter for Always Free eligible shapes
+        )
         free_shapes = [s for s in shapes if 'A1' in s.shape or 'E2.1.Micro' in s.shape]
         
+        if fmt == 'json':
+            write_json([
+                {'shape': s.shape, 'ocpus': s.ocpus, 'memory_in_gbs': s.memory_in_gbs}
+                for s in free_shapes
+            ])
+            return
+        
         print(f"{Fore.GREEN}Always Free Eligible Shapes:\n")
+        yellow = Fore.YELLOW
         for shape in free_shapes:
-            print(f"  {Fore.YELLOW}{shape.shape}")
-            if hasattr(shape, 'ocpus'):
-                print(f"    OCPUs: {shape.ocpus}, Memory: {shape.memory_in_gbs} GB")
+            print(f"  {yellow}{shape.shape}")
+            # The OCI model always has the attribute; it is None when not reported
+            ocpus = getattr(shape, 'ocpus', None)
+            if ocpus is not None:
+                print(f"    OCPUs: {ocpus}, Memory: {shape.memory_in_gbs} GB")
             print()
         
         print(f"{Fore.CYAN}Note: VM.Standard.A1.Flex allows up to 4 OCPUs and 24GB RAM total (free)")
         print(f"{Fore.CYAN}      VM.Standard.E2.1.Micro: 1 OCPU, 1GB RAM (2 instances free)")
         
     except Exception as e:
-        print(f"{Fore.RED}✗ Failed to list shapes: {e}")
+        logger.error("Failed to list shapes: %s", e)
+        return False
 
 
 def validate_config(config: dict):
     """Validate the configuration."""
-    print(f"\n{Fore.CYAN}{'='*60}")
-    print(f"{Fore.CYAN}Validating Configuration")
-    print(f"{Fore.CYAN}{'='*60}\n")
+    print_banner("Validating Configuration")
     
     errors = []
     warnings = []
     
     # Check required fields
-    required_fields = ['user', 'tenancy', 'region', 'fingerprint', 'key_file', 'compartment']
-    for field in required_fields:
-        if not config.get(field):
-            errors.append(f"Missing {field.upper().replace('_', ' ')}")
+    errors.extend(
+        f"Missing {REQUIRED_FIELD_LABELS[field]}"
+        for field in REQUIRED_FIELDS if not config.get(field)
+    )
     
     # Check key file exists
-    key_file = Path(config.get('key_file', ''))
-    if not key_file.is_absolute():
-        key_file = Path(__file__).parent / key_file
-    
-    if not key_file.exists():
+    key_file = config.get('key_file')
+    if key_file and not Path(key_file).exists():
         errors.append(f"Private key file not found: {key_file}")
     
     # Check SSH key file
-    ssh_key = os.getenv('SSH_PUBLIC_KEY_FILE')
+    ssh_key = config.get('ssh_key_file')
     if ssh_key:
-        ssh_key_path = Path(ssh_key)
-        if not ssh_key_path.is_absolute():
-            ssh_key_path = Path(__file__).parent / ssh_key_path
-        if not ssh_key_path.exists():
-            errors.append(f"SSH public key file not found: {ssh_key_path}")
+        if not Path(ssh_key).exists():
+            errors.append(f"SSH public key file not found: {ssh_key}")
     else:
         warnings.append("SSH_PUBLIC_KEY_FILE not set")
     
     # Check other important env vars
-    required_env_vars = [
-        'INSTANCE_DISPLAY_NAME',
-        'AVAILABILITY_DOMAIN',
-        'INSTANCE_SHAPE',
-        'SUBNET_OCID',
-        'IMAGE_OCID',
-    ]
-    
-    for var in required_env_vars:
-        if not os.getenv(var):
-            errors.append(f"Missing {var} in .env")
+    env = os.environ
+    errors.extend(
+        f"Missing {var} in .env"
+        for var in REQUIRED_ENV_VARS if not env.get(var)
+    )
     
     # Print results
     if errors:
@@ -300,7 +478,105 @@ def validate_config(config: dict):
         return False
 
 
+def require_oci_config(config: dict):
+    """Exit before importing the SDK or calling OCI if connection settings are missing."""
+    try:
+        create_oci_config(config)
+    except ValueError as e:
+        logger.error("%s\n%s  Run with --validate for a full configuration check", e, Fore.YELLOW)
+        sys.exit(1)
+
+
+def validate_and_authenticate(config: dict) -> bool:
+    """Validate the configuration, then test authentication if it is valid."""
+    return validate_config(config) and test_authentication(config)
+
+
+# Single-flag invocations dispatched without building the argument parser
+_FAST_DISPATCH = {
+    '--validate': validate_and_authenticate,
+    '--test-auth': test_authentication,
+    '--list-ads': list_availability_domains,
+    '--list-images': list_images,
+    '--list-shapes': list_shapes,
+}
+
+
+class ThreadBufferedStdout:
+    """stdout proxy that redirects writes from worker threads to per-thread buffers."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def start_buffer(self) -> io.StringIO:
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        return buffer
+    
+    def stop_buffer(self):
+        self._local.buffer = None
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            return self._stream.write(text)
+        buffer.write(text)
+        if HAS_COLOR:
+            # Same as colorama's autoreset, which only sees the final combined write
+            buffer.write(Style.RESET_ALL)
+        return len(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def run_actions(actions: list) -> list:
+    """
+    Run independent operations concurrently and return their results in order.
+    
+    Each operation's output is buffered and printed as one block, in the order
+    the operations were given, so the output matches a sequential run.
+    """
+    if len(actions) <= 1:
+        return [action() for action in actions]
+    
+    stdout = sys.stdout
+    proxy = ThreadBufferedStdout(stdout)
+    
+    def run(action):
+        buffer = proxy.start_buffer()
+        try:
+            return action(), buffer.getvalue()
+        finally:
+            proxy.stop_buffer()
+    
+    results = []
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=min(len(actions), MAX_PARALLEL_ACTIONS)) as executor:
+            futures = [executor.submit(run, action) for action in actions]
+            for future in futures:
+                result, output = future.result()
+                stdout.write(output)
+                stdout.flush()
+                results.append(result)
+    finally:
+        sys.stdout = stdout
+    
+    return results
+
+
 def main():
+    # Common single-flag runs don't need argparse
+    if len(sys.argv) == 2 and sys.argv[1] in _FAST_DISPATCH:
+        config = load_config()
+        # --validate reports missing settings itself and skips the auth test
+        if sys.argv[1] != '--validate':
+            require_oci_config(config)
+        result = _FAST_DISPATCH[sys.argv[1]](config)
+        sys.exit(0 if result is not False else 1)
+    
     parser = argparse.ArgumentParser(
         description='OCI Instance Hunter - Helper Scripts',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -320,9 +596,14 @@ def main():
                        help='Filter images by shape (e.g., VM.Standard.A1.Flex)')
     parser.add_argument('--os', type=str,
                        help='Filter images by OS (e.g., "Canonical Ubuntu", "Oracle Linux")')
+    parser.add_argument('--json', action='store_true',
+                       help='Print --list-* results as JSON (one document per line)')
     
     args = parser.parse_args()
     
+    if args.json:
+        _handler.to_stderr = True
+    
     # If no arguments, show help and run validate
     if len(sys.argv) == 1:
         parser.print_help()
@@ -332,25 +613,30 @@ def main():
     # Load config
     config = load_config()
     
-    # Run requested operations
-    success = True
+    fmt = 'json' if args.json else 'text'
+    
+    # Run requested operations (concurrently when more than one is requested)
+    actions = []
     
     if args.test_auth:
-        success = test_authentication(config) and success
+        actions.append(lambda: test_authentication(config))
     
     if args.list_ads:
-        list_availability_domains(config)
+        actions.append(lambda: list_availability_domains(config, fmt=fmt))
     
     if args.list_images:
-        list_images(config, shape=args.shape, os_name=args.os)
+        actions.append(lambda: list_images(config, shape=args.shape, os_name=args.os, fmt=fmt))
     
     if args.list_shapes:
-        list_shapes(config)
+        actions.append(lambda: list_shapes(config, fmt=fmt))
     
     if args.validate:
-        success = validate_config(config) and success
-        if success:
-            success = test_authentication(config) and success
+        actions.append(lambda: validate_and_authenticate(config))
+    elif actions:
+        require_oci_config(config)
+    
+    # Successful operations may return None; only explicit failures count
+    success = all(result is not False for result in run_actions(actions))
     
     sys.exit(0 if success else 1)
 